@@ -29,17 +29,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         tracker_configs = cast(
             list[dict[str, Any]], (config or {}).get(DOMAIN, {}).get(CONF_TRACKERS, [])
         )
-        tracker_ids = [conf[CONF_ID] for conf in tracker_configs]
-
-        for conf in tracker_configs:
-            # New config entries and changed existing ones can be processed later and do
-            # not need to delay startup.
-            hass.async_create_background_task(
-                hass.config_entries.flow.async_init(
-                    DOMAIN, context={"source": SOURCE_IMPORT}, data=conf
-                ),
-                "Import YAML config",
-            )
+        tracker_ids = {conf[CONF_ID] for conf in tracker_configs}
 
         tasks: list[Coroutine[Any, Any, Any]] = []
         for entry in hass.config_entries.async_entries(DOMAIN):
@@ -59,6 +49,16 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         if tasks:
             await asyncio.gather(*tasks)
 
+        for conf in tracker_configs:
+            # New config entries and changed existing ones can be processed later and do
+            # not need to delay startup.
+            hass.async_create_background_task(
+                hass.config_entries.flow.async_init(
+                    DOMAIN, context={"source": SOURCE_IMPORT}, data=conf
+                ),
+                "Import YAML config",
+            )
+
     async def reload_config(_: ServiceCall) -> None:
         """Reload configuration."""
         await process_config(await async_integration_yaml_config(hass, DOMAIN))
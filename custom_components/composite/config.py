@@ -35,30 +35,30 @@ PACKAGE_MERGE_HINT = "dict"
 CONF_TZ_FINDER = "tz_finder"
 CONF_TZ_FINDER_CLASS = "tz_finder_class"
 
+_UNSUPPORTED_CFGS = (CONF_TZ_FINDER, CONF_TZ_FINDER_CLASS)
+
 
 def _entities(entities: list[str | dict]) -> list[dict]:
     """Convert entity ID to dict of entity, all_states & use_picture.
 
     Also ensure no more than one entity has use_picture set to true.
     """
-    result: list[dict] = []
-    already_using_picture = False
-    for idx, entity in enumerate(entities):
-        if isinstance(entity, dict):
-            if entity[CONF_USE_PICTURE]:
-                if already_using_picture:
-                    raise vol.Invalid(
-                        f"{CONF_USE_PICTURE} may only be true for one entity per "
-                        "composite tracker",
-                        path=[idx, CONF_USE_PICTURE],
-                    )
-                already_using_picture = True
-            result.append(entity)
-        else:
-            result.append(
-                {CONF_ENTITY: entity, CONF_ALL_STATES: False, CONF_USE_PICTURE: False}
-            )
-    return result
+    picture_idxs = [
+        idx
+        for idx, entity in enumerate(entities)
+        if isinstance(entity, dict) and entity[CONF_USE_PICTURE]
+    ]
+    if len(picture_idxs) > 1:
+        raise vol.Invalid(
+            f"{CONF_USE_PICTURE} may only be true for one entity per composite tracker",
+            path=[picture_idxs[1], CONF_USE_PICTURE],
+        )
+    return [
+        entity
+        if isinstance(entity, dict)
+        else {CONF_ENTITY: entity, CONF_ALL_STATES: False, CONF_USE_PICTURE: False}
+        for entity in entities
+    ]
 
 
 def _entity_picture(entity_picture: str) -> str:
@@ -95,11 +95,11 @@ def _trackers(
     for t_idx, tracker in enumerate(trackers):
         if CONF_ID not in tracker:
             name: str = tracker[CONF_NAME]
-            if name == slugify(name):
-                tracker[CONF_ID] = name
+            if (obj_id := slugify(name)) == name:
                 tracker[CONF_NAME] = name.replace("_", " ").title()
-            else:
-                tracker[CONF_ID] = cv.slugify(tracker[CONF_NAME])
+            elif not obj_id:
+                raise vol.Invalid(f"Unable to slugify {name}", path=[t_idx, CONF_NAME])
+            tracker[CONF_ID] = obj_id
         ids.append(cast(str, tracker[CONF_ID]))
         if tracker.get(CONF_ENTITY_PICTURE):
             for e_idx, entity in enumerate(tracker[CONF_ENTITY_ID]):
@@ -120,10 +120,9 @@ def _defaults(config: dict) -> dict:
     Also warn about options no longer supported.
     """
     unsupported_cfgs = set()
-    if config.pop(CONF_TZ_FINDER, None):
-        unsupported_cfgs.add(CONF_TZ_FINDER)
-    if config.pop(CONF_TZ_FINDER_CLASS, None):
-        unsupported_cfgs.add(CONF_TZ_FINDER_CLASS)
+    for unsupported_cfg in _UNSUPPORTED_CFGS:
+        if config.pop(unsupported_cfg, None):
+            unsupported_cfgs.add(unsupported_cfg)
     if config[CONF_DEFAULT_OPTIONS].pop(CONF_TIME_AS, None):
         unsupported_cfgs.add(CONF_TIME_AS)
 
@@ -2,9 +2,13 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from contextlib import suppress
+import errno
 from functools import cached_property
 import logging
+import os
 from pathlib import Path
+import re
 import shutil
 from typing import Any, cast
 
@@ -59,30 +63,57 @@ from .const import (
     CONF_REQ_MOVEMENT,
     CONF_USE_PICTURE,
     DOMAIN,
-    MIME_TO_SUFFIX,
     PICTURE_SUFFIXES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_PICTURE_SUFFIXES = frozenset(PICTURE_SUFFIXES)
+_PICTURE_EXTS = tuple(f".{suffix}" for suffix in PICTURE_SUFFIXES)
+_UPLOADED_FILE_RE = re.compile(r"image(\d{3,})\.(\w+)")
+
+_INPUT_DOMAINS = frozenset((BS_DOMAIN, DT_DOMAIN))
+
+_SPLIT_CONF_KW = {
+    CONF_NAME: "data",
+    CONF_ID: "data",
+    CONF_ENTITY_ID: "options",
+    CONF_REQ_MOVEMENT: "options",
+    CONF_DRIVING_SPEED: "options",
+    CONF_ENTITY_PICTURE: "options",
+}
+
+_BOOLEAN_SELECTOR = BooleanSelector()
+_NAME_SCHEMA = vol.Schema({vol.Required(CONF_NAME): TextSelector()})
+_UPLOAD_ACCEPT = ", ".join(_PICTURE_EXTS)
+_UPLOAD_FILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ENTITY_PICTURE): FileSelector(
+            FileSelectorConfig(accept=_UPLOAD_ACCEPT)
+        )
+    }
+)
+
 
 def split_conf(conf: dict[str, Any]) -> dict[str, dict[str, Any]]:
     """Return pieces of configuration data."""
-    return {
-        kw: {k: v for k, v in conf.items() if k in ks}
-        for kw, ks in (
-            ("data", (CONF_NAME, CONF_ID)),
-            (
-                "options",
-                (
-                    CONF_ENTITY_ID,
-                    CONF_REQ_MOVEMENT,
-                    CONF_DRIVING_SPEED,
-                    CONF_ENTITY_PICTURE,
-                ),
-            ),
-        )
-    }
+    pieces: dict[str, dict[str, Any]] = {"data": {}, "options": {}}
+    for key, value in conf.items():
+        if (kw := _SPLIT_CONF_KW.get(key)) is not None:
+            pieces[kw][key] = value
+    return pieces
+
+
+def _input_entity(state: State) -> bool:
+    """Return if entity should be included in input list."""
+    if state.domain in _INPUT_DOMAINS:
+        return True
+    attributes = state.attributes
+    if ATTR_GPS_ACCURACY not in attributes and ATTR_ACC not in attributes:
+        return False
+    return (ATTR_LATITUDE in attributes and ATTR_LONGITUDE in attributes) or (
+        ATTR_LAT in attributes and ATTR_LON in attributes
+    )
 
 
 class CompositeFlow(FlowHandler):
@@ -111,13 +142,15 @@ class CompositeFlow(FlowHandler):
             return []
 
         local_files: list[str] = []
-        for suffix in PICTURE_SUFFIXES:
-            local_files.extend(
-                [
-                    str(local_file.relative_to(local_dir))
-                    for local_file in local_dir.rglob(f"*.{suffix}")
-                ]
-            )
+        dirs = [str(local_dir)]
+        prefix_len = len(dirs[0]) + 1
+        while dirs:
+            with suppress(PermissionError), os.scandir(dirs.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                    elif entry.name.endswith(_PICTURE_EXTS):
+                        local_files.append(entry.path[prefix_len:])
         return sorted(local_files)
 
     @cached_property
@@ -127,12 +160,18 @@ class CompositeFlow(FlowHandler):
             return UnitOfSpeed.KILOMETERS_PER_HOUR
         return UnitOfSpeed.MILES_PER_HOUR
 
-    @property
-    @abstractmethod
-    def options(self) -> dict[str, Any]:
-        """Return mutable copy of options."""
+    @cached_property
+    def _driving_speed_selector(self) -> NumberSelector:
+        """Return driving speed selector in speed unit_of_measurement."""
+        return NumberSelector(
+            NumberSelectorConfig(
+                unit_of_measurement=self._speed_uom, mode=NumberSelectorMode.BOX
+            )
+        )
 
-    @property
+    options: dict[str, Any]
+
+    @cached_property
     def _entity_ids(self) -> list[str]:
         """Get currently configured entity IDs."""
         return [cfg[CONF_ENTITY] for cfg in self.options.get(CONF_ENTITY_ID, [])]
@@ -145,11 +184,14 @@ class CompositeFlow(FlowHandler):
 
         local_file is relative to "/local".
         """
-        entity_id = None
-        for cfg in self.options[CONF_ENTITY_ID]:
-            if cfg[CONF_USE_PICTURE]:
-                entity_id = cfg[CONF_ENTITY]
-                break
+        entity_id = next(
+            (
+                cfg[CONF_ENTITY]
+                for cfg in self.options[CONF_ENTITY_ID]
+                if cfg[CONF_USE_PICTURE]
+            ),
+            None,
+        )
         if local_file := cast(str | None, self.options.get(CONF_ENTITY_PICTURE)):
             local_file = local_file.removeprefix("/local/")
         return entity_id, local_file
@@ -178,12 +220,22 @@ class CompositeFlow(FlowHandler):
         with process_uploaded_file(self.hass, uploaded_file_id) as uf_path:
             ud = self._uploaded_dir
             ud.mkdir(parents=True, exist_ok=True)
-            suffix = MIME_TO_SUFFIX[filetype.guess_mime(uf_path)]
-            fn = ud / f"x.{suffix}"
+            if (suffix := filetype.guess_extension(uf_path)) not in _PICTURE_SUFFIXES:
+                raise ValueError(f"Unsupported picture file type: {suffix}")
             idx = 0
-            while (uf := fn.with_stem(f"image{idx:03d}")).exists():
-                idx += 1
-            shutil.move(uf_path, uf)
+            with os.scandir(ud) as entries:
+                for entry in entries:
+                    if (
+                        match := _UPLOADED_FILE_RE.fullmatch(entry.name)
+                    ) and match[2] == suffix:
+                        idx = max(idx, int(match[1]) + 1)
+            uf = ud / f"image{idx:03d}.{suffix}"
+            try:
+                os.replace(uf_path, uf)
+            except OSError as err:
+                if err.errno != errno.EXDEV:
+                    raise
+                shutil.move(uf_path, uf)
             return str(uf.relative_to(self._local_dir))
 
     async def async_step_options(
@@ -191,52 +243,42 @@ class CompositeFlow(FlowHandler):
     ) -> FlowResult:
         """Get config options."""
         errors = {}
+        options = self.options
 
         if user_input is not None:
-            self.options[CONF_REQ_MOVEMENT] = user_input[CONF_REQ_MOVEMENT]
+            options[CONF_REQ_MOVEMENT] = user_input[CONF_REQ_MOVEMENT]
             if CONF_DRIVING_SPEED in user_input:
-                self.options[CONF_DRIVING_SPEED] = SpeedConverter.convert(
+                options[CONF_DRIVING_SPEED] = SpeedConverter.convert(
                     user_input[CONF_DRIVING_SPEED],
                     self._speed_uom,
                     UnitOfSpeed.METERS_PER_SECOND,
                 )
-            elif CONF_DRIVING_SPEED in self.options:
-                del self.options[CONF_DRIVING_SPEED]
+            elif CONF_DRIVING_SPEED in options:
+                del options[CONF_DRIVING_SPEED]
             prv_cfgs = {
-                cfg[CONF_ENTITY]: cfg for cfg in self.options.get(CONF_ENTITY_ID, [])
+                cfg[CONF_ENTITY]: cfg for cfg in options.get(CONF_ENTITY_ID, [])
             }
-            new_cfgs = [
-                prv_cfgs.get(
-                    entity_id,
-                    {
+            new_cfgs: list[dict[str, Any]] = []
+            for entity_id in user_input[CONF_ENTITY_ID]:
+                if (cfg := prv_cfgs.get(entity_id)) is None:
+                    cfg = {
                         CONF_ENTITY: entity_id,
                         CONF_USE_PICTURE: False,
                         CONF_ALL_STATES: False,
-                    },
-                )
-                for entity_id in user_input[CONF_ENTITY_ID]
-            ]
-            self.options[CONF_ENTITY_ID] = new_cfgs
+                    }
+                new_cfgs.append(cfg)
+            options[CONF_ENTITY_ID] = new_cfgs
+            self.__dict__.pop("_entity_ids", None)
             if new_cfgs:
                 return await self.async_step_ep_menu()
             errors[CONF_ENTITY_ID] = "at_least_one_entity"
 
-        def entity_filter(state: State) -> bool:
-            """Return if entity should be included in input list."""
-            if state.domain in (BS_DOMAIN, DT_DOMAIN):
-                return True
-            attributes = state.attributes
-            if ATTR_GPS_ACCURACY not in attributes and ATTR_ACC not in attributes:
-                return False
-            if ATTR_LATITUDE in attributes and ATTR_LONGITUDE in attributes:
-                return True
-            return ATTR_LAT in attributes and ATTR_LON in attributes
-
         include_entities = set(self._entity_ids)
-        include_entities |= {
+        include_entities.update(
             state.entity_id
-            for state in filter(entity_filter, self.hass.states.async_all())
-        }
+            for state in self.hass.states.async_all()
+            if _input_entity(state)
+        )
         data_schema = vol.Schema(
             {
                 vol.Required(CONF_ENTITY_ID): EntitySelector(
@@ -244,23 +286,18 @@ class CompositeFlow(FlowHandler):
                         include_entities=list(include_entities), multiple=True
                     )
                 ),
-                vol.Required(CONF_REQ_MOVEMENT): BooleanSelector(),
-                vol.Optional(CONF_DRIVING_SPEED): NumberSelector(
-                    NumberSelectorConfig(
-                        unit_of_measurement=self._speed_uom,
-                        mode=NumberSelectorMode.BOX,
-                    )
-                ),
+                vol.Required(CONF_REQ_MOVEMENT): _BOOLEAN_SELECTOR,
+                vol.Optional(CONF_DRIVING_SPEED): self._driving_speed_selector,
             }
         )
-        if CONF_ENTITY_ID in self.options:
+        if CONF_ENTITY_ID in options:
             suggested_values = {
                 CONF_ENTITY_ID: self._entity_ids,
-                CONF_REQ_MOVEMENT: self.options[CONF_REQ_MOVEMENT],
+                CONF_REQ_MOVEMENT: options[CONF_REQ_MOVEMENT],
             }
-            if CONF_DRIVING_SPEED in self.options:
+            if CONF_DRIVING_SPEED in options:
                 suggested_values[CONF_DRIVING_SPEED] = SpeedConverter.convert(
-                    self.options[CONF_DRIVING_SPEED],
+                    options[CONF_DRIVING_SPEED],
                     UnitOfSpeed.METERS_PER_SECOND,
                     self._speed_uom,
                 )
@@ -308,11 +345,7 @@ class CompositeFlow(FlowHandler):
                 )
             }
         )
-        picture_entity_id = None
-        for cfg in self.options[CONF_ENTITY_ID]:
-            if cfg[CONF_USE_PICTURE]:
-                picture_entity_id = cfg[CONF_ENTITY]
-                break
+        picture_entity_id, _ = self._cur_entity_picture
         if picture_entity_id:
             data_schema = self.add_suggested_values_to_schema(
                 data_schema, {CONF_ENTITY: picture_entity_id}
@@ -332,7 +365,7 @@ class CompositeFlow(FlowHandler):
         local_files = self._local_files
         _, local_file = self._cur_entity_picture
         if local_file and local_file not in local_files:
-            local_files.append(local_file)
+            local_files = [*local_files, local_file]
         data_schema = vol.Schema(
             {
                 vol.Optional(CONF_ENTITY_PICTURE): SelectSelector(
@@ -364,21 +397,14 @@ class CompositeFlow(FlowHandler):
             local_file = await self.hass.async_add_executor_job(
                 self._save_uploaded_file, uploaded_file_id
             )
+            self.__dict__.pop("_local_files", None)
             self._set_entity_picture(local_file=local_file)
             if local_dir_exists:
                 return await self.async_step_all_states()
             return await self.async_step_ep_warn()
 
-        accept = ", ".join(f".{ext}" for ext in PICTURE_SUFFIXES)
-        data_schema = vol.Schema(
-            {
-                vol.Optional(CONF_ENTITY_PICTURE): FileSelector(
-                    FileSelectorConfig(accept=accept)
-                )
-            }
-        )
         return self.async_show_form(
-            step_id="ep_upload_file", data_schema=data_schema, last_step=False
+            step_id="ep_upload_file", data_schema=_UPLOAD_FILE_SCHEMA, last_step=False
         )
 
     async def async_step_ep_warn(
@@ -404,7 +430,7 @@ class CompositeFlow(FlowHandler):
     ) -> FlowResult:
         """Specify if all states should be used for appropriate entities."""
         if user_input is not None:
-            entity_ids = user_input.get(CONF_ENTITY, [])
+            entity_ids = frozenset(user_input.get(CONF_ENTITY, []))
             for cfg in self.options[CONF_ENTITY_ID]:
                 cfg[CONF_ALL_STATES] = cfg[CONF_ENTITY] in entity_ids
             return await self.async_step_done()
@@ -443,7 +469,7 @@ class CompositeConfigFlow(ConfigFlow, CompositeFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         """Initialize config flow."""
-        self._options: dict[str, Any] = {}
+        self.options = {}
 
     @staticmethod
     @callback
@@ -457,14 +483,7 @@ class CompositeConfigFlow(ConfigFlow, CompositeFlow, domain=DOMAIN):
     @callback
     def async_supports_options_flow(cls, config_entry: ConfigEntry) -> bool:
         """Return options flow support for this handler."""
-        if config_entry.source == SOURCE_IMPORT:
-            return False
-        return True
-
-    @property
-    def options(self) -> dict[str, Any]:
-        """Return mutable copy of options."""
-        return self._options
+        return config_entry.source != SOURCE_IMPORT
 
     async def async_step_import(self, data: dict[str, Any]) -> FlowResult:
         """Import config entry from configuration."""
@@ -487,15 +506,17 @@ class CompositeConfigFlow(ConfigFlow, CompositeFlow, domain=DOMAIN):
         """Start user config flow."""
         return await self.async_step_name()
 
+    @cached_property
+    def _used_names(self) -> frozenset[str]:
+        """Return names already used by existing config entries."""
+        return frozenset(
+            entry.data[CONF_NAME] if entry.source == SOURCE_IMPORT else entry.title
+            for entry in self._entries
+        )
+
     def _name_used(self, name: str) -> bool:
         """Return if name has already been used."""
-        for entry in self._entries:
-            if entry.source == SOURCE_IMPORT:
-                if name == entry.data[CONF_NAME]:
-                    return True
-            elif name == entry.title:
-                return True
-        return False
+        return name in self._used_names
 
     async def async_step_name(
         self, user_input: dict[str, Any] | None = None
@@ -509,9 +530,8 @@ class CompositeConfigFlow(ConfigFlow, CompositeFlow, domain=DOMAIN):
                 return await self.async_step_options()
             errors[CONF_NAME] = "name_used"
 
-        data_schema = vol.Schema({vol.Required(CONF_NAME): TextSelector()})
         data_schema = self.add_suggested_values_to_schema(
-            data_schema, {CONF_NAME: self._name}
+            _NAME_SCHEMA, {CONF_NAME: self._name}
         )
         return self.async_show_form(
             step_id="name", data_schema=data_schema, errors=errors, last_step=False
@@ -86,11 +86,13 @@ _RESTORE_EXTRA_ATTRS = (
 _SOURCE_TYPE_BINARY_SENSOR = BS_DOMAIN
 _STATE_BINARY_SENSOR_HOME = STATE_ON
 
-_SOURCE_TYPE_NON_GPS = (
-    _SOURCE_TYPE_BINARY_SENSOR,
-    SourceType.BLUETOOTH,
-    SourceType.BLUETOOTH_LE,
-    SourceType.ROUTER,
+_SOURCE_TYPE_NON_GPS = frozenset(
+    (
+        _SOURCE_TYPE_BINARY_SENSOR,
+        SourceType.BLUETOOTH,
+        SourceType.BLUETOOTH_LE,
+        SourceType.ROUTER,
+    )
 )
 
 _GPS_ACCURACY_ATTRS = (ATTR_GPS_ACCURACY, ATTR_ACC)
@@ -98,6 +100,8 @@ _BATTERY_ATTRS = (ATTR_BATTERY_LEVEL, ATTR_BATTERY)
 _CHARGING_ATTRS = (ATTR_BATTERY_CHARGING, ATTR_CHARGING)
 _LAST_SEEN_ATTRS = (ATTR_LAST_SEEN, ATTR_LAST_TIMESTAMP)
 
+_ONE_SECOND = timedelta(seconds=1)
+
 
 async def async_setup_entry(
     _hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -108,9 +112,11 @@ async def async_setup_entry(
 
 def _nearest_second(time: datetime) -> datetime:
     """Round time to nearest second."""
-    return time.replace(microsecond=0) + timedelta(
-        seconds=0 if time.microsecond < 500000 else 1
-    )
+    if not (microsecond := time.microsecond):
+        return time
+    if microsecond < 500000:
+        return time.replace(microsecond=0)
+    return time.replace(microsecond=0) + _ONE_SECOND
 
 
 class EntityStatus(Enum):
@@ -122,7 +128,7 @@ class EntityStatus(Enum):
     SUSPEND = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """Location (latitude, longitude & accuracy)."""
 
@@ -130,7 +136,7 @@ class Location:
     accuracy: int
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityData:
     """Input entity data."""
 
@@ -147,27 +153,31 @@ class EntityData:
         self.use_all_states = use_all_states
         self.use_picture = use_picture
 
-    def good(self, seen: datetime, source_type: str, data: Location | str) -> None:
-        """Mark entity as good."""
+    def good(self, seen: datetime, source_type: str, data: Location | str) -> bool:
+        """Mark entity as good.
+
+        Returns True if this is the first time entity has been good.
+        """
+        first = self.source_type is None
         self.status = EntityStatus.ACTIVE
         self.seen = seen
         self.source_type = source_type
         self.data = data
+        return first
 
     def bad(self, message: str) -> None:
         """Mark entity as bad."""
         if self.status == EntityStatus.SUSPEND:
             return
-        msg = f"{self.entity_id} {message}"
         if self.status == EntityStatus.WARNED:
-            _LOGGER.error(msg)
+            _LOGGER.error("%s %s", self.entity_id, message)
             self.status = EntityStatus.SUSPEND
         # Only warn if this is not the first state change for the entity.
         elif self.status == EntityStatus.ACTIVE:
-            _LOGGER.warning(msg)
+            _LOGGER.warning("%s %s", self.entity_id, message)
             self.status = EntityStatus.WARNED
         else:
-            _LOGGER.debug(msg)
+            _LOGGER.debug("%s %s", self.entity_id, message)
             self.status = EntityStatus.ACTIVE
 
 
@@ -182,6 +192,10 @@ class Attributes:
         """Implement Attributes_object[key]."""
         return self._attrs[key]
 
+    def __contains__(self, key: str) -> bool:
+        """Implement key in Attributes_object."""
+        return key in self._attrs
+
     def get(self, key: str | Sequence[str], default: Any | None = None) -> Any | None:
         """Get item for first found key, or default if no key found."""
         if isinstance(key, str):
@@ -207,6 +221,7 @@ class CompositeDeviceTracker(TrackerEntity, RestoreEntity):
     _longitude: float | None = None
 
     _prev_seen: datetime | None = None
+    _seen_entity_ids: tuple[str, ...] | None = None
     _remove_track_states: Callable[[], None] | None = None
     _req_movement: bool
     _driving_speed: float | None  # m/s
@@ -224,6 +239,7 @@ class CompositeDeviceTracker(TrackerEntity, RestoreEntity):
             self._attr_unique_id = entry.entry_id
         self._attr_extra_state_attributes = {}
         self._entities: dict[str, EntityData] = {}
+        self._speed_signal = f"{SIG_COMPOSITE_SPEED}-{self._attr_unique_id}"
 
     @property
     def force_update(self) -> bool:
@@ -295,6 +311,8 @@ class CompositeDeviceTracker(TrackerEntity, RestoreEntity):
         del_entity_ids = cur_entity_ids - cfg_entity_ids
         new_entity_ids = cfg_entity_ids - cur_entity_ids
         cur_entity_ids &= cfg_entity_ids
+        if del_entity_ids or new_entity_ids:
+            self._seen_entity_ids = None
 
         last_entity_id = (
             self.extra_state_attributes
@@ -320,7 +338,9 @@ class CompositeDeviceTracker(TrackerEntity, RestoreEntity):
             )
 
         for entity_id in cfg_entity_ids:
-            await self._entity_updated(entity_id, self.hass.states.get(entity_id))
+            await self._entity_updated(
+                entity_id, self.hass.states.get(entity_id), reevaluate=True
+            )
 
         self._use_entity_picture = True
         if entity_picture := options.get(CONF_ENTITY_PICTURE):
@@ -331,10 +351,17 @@ class CompositeDeviceTracker(TrackerEntity, RestoreEntity):
 
         async def state_listener(event: Event) -> None:
             """Process input entity state update."""
+            prev_seen = self._prev_seen
+            entity_picture = self._attr_entity_picture
             await self.async_request_call(
                 self._entity_updated(event.data["entity_id"], event.data["new_state"])
             )
-            self.async_write_ha_state()
+            # Only write state if update was used or entity picture changed.
+            if (
+                self._prev_seen != prev_seen
+                or self._attr_entity_picture != entity_picture
+            ):
+                self.async_write_ha_state()
 
         if self._remove_track_states:
             self._remove_track_states()
@@ -402,7 +429,7 @@ class CompositeDeviceTracker(TrackerEntity, RestoreEntity):
         self._prev_seen = None
 
     async def _entity_updated(  # noqa: C901
-        self, entity_id: str, new_state: State | None
+        self, entity_id: str, new_state: State | None, reevaluate: bool = False
     ) -> None:
         """Run when an input entity has changed state."""
         if not new_state or new_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
@@ -420,12 +447,20 @@ class CompositeDeviceTracker(TrackerEntity, RestoreEntity):
                 return None
             if isinstance(raw_last_seen, datetime):
                 return dt_util.as_utc(raw_last_seen)
-            with suppress(TypeError, ValueError):
-                return dt_util.utc_from_timestamp(float(raw_last_seen))
-            with suppress(TypeError):
-                if (parsed_last_seen := dt_util.parse_datetime(raw_last_seen)) is None:
-                    return None
+            if not isinstance(raw_last_seen, str):
+                with suppress(TypeError, ValueError):
+                    return dt_util.utc_from_timestamp(float(raw_last_seen))
+                return None
+            # Only try a string as a timestamp first if it looks like one, to avoid
+            # raising ValueError for the more common datetime strings.
+            if raw_last_seen.replace(".", "", 1).isdecimal():
+                with suppress(ValueError):
+                    return dt_util.utc_from_timestamp(float(raw_last_seen))
+                return None
+            if (parsed_last_seen := dt_util.parse_datetime(raw_last_seen)) is not None:
                 return dt_util.as_utc(parsed_last_seen)
+            with suppress(ValueError):
+                return dt_util.utc_from_timestamp(float(raw_last_seen))
             return None
 
         # Use last_updated from the new state object if no valid "last seen" was found.
@@ -438,11 +473,10 @@ class CompositeDeviceTracker(TrackerEntity, RestoreEntity):
 
         # Try to get GPS and battery data.
         gps: GPSType | None = None
-        with suppress(KeyError):
+        if ATTR_LATITUDE in new_attrs and ATTR_LONGITUDE in new_attrs:
             gps = new_attrs[ATTR_LATITUDE], new_attrs[ATTR_LONGITUDE]
-        if not gps:
-            with suppress(KeyError):
-                gps = new_attrs[ATTR_LAT], new_attrs[ATTR_LON]
+        elif ATTR_LAT in new_attrs and ATTR_LON in new_attrs:
+            gps = new_attrs[ATTR_LAT], new_attrs[ATTR_LON]
         gps_accuracy = cast(int | None, new_attrs.get(_GPS_ACCURACY_ATTRS))
         battery = cast(int | None, new_attrs.get(_BATTERY_ATTRS))
         charging = cast(bool | None, new_attrs.get(_CHARGING_ATTRS))
@@ -475,10 +509,14 @@ class CompositeDeviceTracker(TrackerEntity, RestoreEntity):
             old_data = cast(Location | None, entity.data)
             if last_seen == old_last_seen and new_data == old_data:
                 return
-            entity.good(last_seen, source_type, new_data)
+            self._entity_good(entity, last_seen, source_type, new_data)
 
             if self._req_movement and old_data:
-                dist = distance(gps[0], gps[1], old_data.gps[0], old_data.gps[1])
+                dist: float | None
+                if gps == old_data.gps:
+                    dist = 0
+                else:
+                    dist = distance(gps[0], gps[1], old_data.gps[0], old_data.gps[1])
                 if dist is not None and dist <= gps_accuracy + old_data.accuracy:
                     _LOGGER.debug(
                         "For %s skipping update from %s: not enough movement",
@@ -496,7 +534,15 @@ class CompositeDeviceTracker(TrackerEntity, RestoreEntity):
                 else:
                     state = STATE_NOT_HOME
 
-            entity.good(last_seen, source_type, state)
+            # Skip repeated state, unless options may have changed how it is used.
+            if (
+                not reevaluate
+                and last_seen == old_last_seen
+                and source_type == entity.source_type
+                and state == entity.data
+            ):
+                return
+            self._entity_good(entity, last_seen, source_type, state)
 
             if not self._use_non_gps_data(entity_id, state):
                 return
@@ -549,24 +595,27 @@ class CompositeDeviceTracker(TrackerEntity, RestoreEntity):
 
         # Is this newer info than last update?
         if self._prev_seen and last_seen <= self._prev_seen:
-            _LOGGER.debug(
-                "For %s skipping update from %s: "
-                "last_seen not newer than previous update (%s) <= (%s)",
-                self.entity_id,
-                entity_id,
-                dt_util.as_local(last_seen),
-                dt_util.as_local(self._prev_seen),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "For %s skipping update from %s: "
+                    "last_seen not newer than previous update (%s) <= (%s)",
+                    self.entity_id,
+                    entity_id,
+                    dt_util.as_local(last_seen),
+                    dt_util.as_local(self._prev_seen),
+                )
             return
 
         _LOGGER.debug("Updating %s from %s", self.entity_id, entity_id)
 
-        attrs = {
-            ATTR_ENTITIES: tuple(
+        if self._seen_entity_ids is None:
+            self._seen_entity_ids = tuple(
                 entity_id
                 for entity_id, _entity in self._entities.items()
                 if _entity.source_type
-            ),
+            )
+        attrs = {
+            ATTR_ENTITIES: self._seen_entity_ids,
             ATTR_LAST_ENTITY_ID: entity_id,
             ATTR_LAST_SEEN: dt_util.as_local(_nearest_second(last_seen)),
         }
@@ -577,6 +626,17 @@ class CompositeDeviceTracker(TrackerEntity, RestoreEntity):
 
         self._prev_seen = last_seen
 
+    def _entity_good(
+        self,
+        entity: EntityData,
+        seen: datetime,
+        source_type: str,
+        data: Location | str,
+    ) -> None:
+        """Mark input entity as good."""
+        if entity.good(seen, source_type, data):
+            self._seen_entity_ids = None
+
     def _set_state(
         self,
         location_name: str | None,
@@ -655,19 +715,16 @@ class CompositeDeviceTracker(TrackerEntity, RestoreEntity):
         ):
             self._location_name = STATE_DRIVING
         _LOGGER.debug("%s: Sending speed: %s m/s, angle: %s°", self.name, speed, angle)
-        async_dispatcher_send(
-            self.hass, f"{SIG_COMPOSITE_SPEED}-{self.unique_id}", speed, angle
-        )
+        async_dispatcher_send(self.hass, self._speed_signal, speed, angle)
 
     def _use_non_gps_data(self, entity_id: str, state: str) -> bool:
         """Determine if state should be used for non-GPS based entity."""
         if state == STATE_HOME or self._entities[entity_id].use_all_states:
             return True
-        entities = self._entities.values()
-        if any(entity.source_type == SourceType.GPS for entity in entities):
-            return False
-        return all(
-            cast(str, entity.data) != STATE_HOME
-            for entity in entities
-            if entity.source_type in _SOURCE_TYPE_NON_GPS
-        )
+        # Don't use if any GPS based entity, or any non-GPS based entity that is home.
+        for entity in self._entities.values():
+            if entity.source_type == SourceType.GPS:
+                return False
+            if entity.source_type in _SOURCE_TYPE_NON_GPS and entity.data == STATE_HOME:
+                return False
+        return True
@@ -19,6 +19,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import ATTR_ANGLE, ATTR_DIRECTION, SIG_COMPOSITE_SPEED
 
+_COMPASS_POINTS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW", "N")
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -27,6 +29,13 @@ async def async_setup_entry(
     async_add_entities([CompositeSensor(hass, entry)])
 
 
+def _direction(angle: int | None) -> str | None:
+    """Determine compass direction."""
+    if angle is None:
+        return None
+    return _COMPASS_POINTS[int((angle + 360 / 16) // (360 / 8))]
+
+
 class CompositeSensor(SensorEntity):
     """Composite Sensor Entity."""
 
@@ -88,20 +97,11 @@ class CompositeSensor(SensorEntity):
 
     async def _update(self, value: float | None, angle: int | None) -> None:
         """Update sensor with new value."""
-
-        def direction(angle: int | None) -> str | None:
-            """Determine compass direction."""
-            if angle is None:
-                return None
-            return ("N", "NE", "E", "SE", "S", "SW", "W", "NW", "N")[
-                int((angle + 360 / 16) // (360 / 8))
-            ]
-
         self._attr_native_value = value
         self._attr_force_update = bool(value)
         self._attr_extra_state_attributes = {
             ATTR_ANGLE: angle,
-            ATTR_DIRECTION: direction(angle),
+            ATTR_DIRECTION: _direction(angle),
         }
         # It's possible for dispatcher signal to arrive, causing this method to execute,
         # before this sensor entity has been completely "added to hass", meaning